@@ -16,9 +16,10 @@
 # limitations under the License.
 #
 
+import os
 import re
 from datetime import datetime
-from typing import TYPE_CHECKING, Any
+from typing import IO, TYPE_CHECKING, Any, Union
 
 # import numpy as np
 from nomad.units import ureg
@@ -28,6 +29,23 @@ if TYPE_CHECKING:
         BoundLogger,
     )
 
+# Patterns used by `read_xrf_txt`, compiled once on import
+MEASUREMENT_SEPARATOR_RE = re.compile(r'_{100,}\n')
+META_RE = re.compile(
+    r'PositionType\s+Application\s+Sample name\s+Date\s+(\S+)\s+'
+    r'Quant analysis\s+(\S+(?:\s\S+)*)\s+(\S+)\s+'
+    r'(\d{4}-\s*\d{1,2}-\s*\d{1,2}\s+\d{1,2}:\d{2})'
+)
+NAMES_RE = re.compile(r'Component\s+(.*?)\s+Analyzed value')
+VALUES_RE = re.compile(r'Analyzed value\s+(.*?)\s+Unit')
+UNITS_RE = re.compile(r'Unit\s+(.*?)\s+Component')
+INT_PEAK_ELEMENTS_RE = re.compile(r'Component\s+(.*?)\s+Element line')
+INT_PEAK_LINES_RE = re.compile(r'Element line\s+(.*?)\s+Peak intensity')
+INT_PEAK_VALUES_RE = re.compile(r'Peak intensity\s+(.*?)\s+BG intensity')
+INT_BACKGROUND_LINES_RE = re.compile(r'Element line\s+(.*?)\s+Peak/BG')
+INT_BACKGROUND_TYPES_RE = re.compile(r'Peak/BG\s+(.*?)\s+Meas. intensity')
+INT_BACKGROUND_VALUES_RE = re.compile(r'Meas. intensity\s+(.*?)\n')
+
 
 def group_composition_into_layers(
         layers: dict = {},
@@ -133,61 +151,54 @@ def sort_intensity_values_into_layers(  # noqa: PLR0913
 
     return layers
 
-def read_xrf_txt(file_path: str, logger: 'BoundLogger' = None) -> dict[str, Any]:  # noqa: PLR0915, PLR0912
+def read_xrf_txt(  # noqa: PLR0915, PLR0912
+    source: Union[str, os.PathLike, IO], logger: 'BoundLogger' = None
+) -> dict[str, Any]:
     """
     Function for reading the X-ray fluorescence data in a UBIK `.txt` file.
 
     Args:
-        file_path (str): The path to the `.txt` file.
+        source (Union[str, os.PathLike, IO]): The path to the `.txt` file or an
+            opened text or binary file object. Paths and binary files are decoded
+            as UTF-8.
         logger (BoundLogger): A structlog logger.
 
     Returns:
         dict[str, Any]: The X-ray fluorescence data in a Python dictionary.
     """
 
-    with open(file_path) as file:
-        data = file.read()
+    # Read the whole file in one go
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, encoding='utf-8') as file:
+            data = file.read()
+    else:
+        data = source.read()
+    if isinstance(data, bytes):
+        data = data.decode('utf-8')
 
     xrf_dict = dict()
 
     # Splitting data into individual measurements
-    measurements = re.split(r'_{100,}\n', data)
+    measurements = MEASUREMENT_SEPARATOR_RE.split(data)
     for measurement in measurements:
         if len(measurement) > 100:  # noqa: PLR2004
             # Try to match meta information
-            meta_match = re.search(
-                (r'PositionType\s+Application\s+Sample name\s+Date\s+(\S+)\s+'
-                 r'Quant analysis\s+(\S+(?:\s\S+)*)\s+(\S+)\s+'
-                 r'(\d{4}-\s*\d{1,2}-\s*\d{1,2}\s+\d{1,2}:\d{2})'),
-                measurement,
-            )
+            meta_match = META_RE.search(measurement)
 
             # Try to match layers/elements and their thickness/shares
-            names_match = re.findall(r'Component\s+(.*?)\s+Analyzed value', measurement)
-            values_match = re.findall(r'Analyzed value\s+(.*?)\s+Unit', measurement)
-            units_match = re.findall(r'Unit\s+(.*?)\s+Component', measurement)
+            names_match = NAMES_RE.findall(measurement)
+            values_match = VALUES_RE.findall(measurement)
+            units_match = UNITS_RE.findall(measurement)
 
             # Try to match peak intensity values
-            int_peak_elements_match = re.findall(
-                r'Component\s+(.*?)\s+Element line', measurement
-            )
-            int_peak_lines_match = re.findall(
-                r'Element line\s+(.*?)\s+Peak intensity', measurement
-            )
-            int_peak_values_match = re.findall(
-                r'Peak intensity\s+(.*?)\s+BG intensity', measurement
-            )
+            int_peak_elements_match = INT_PEAK_ELEMENTS_RE.findall(measurement)
+            int_peak_lines_match = INT_PEAK_LINES_RE.findall(measurement)
+            int_peak_values_match = INT_PEAK_VALUES_RE.findall(measurement)
 
             # Try to match background intensity values
-            int_background_lines_match = re.findall(
-                r'Element line\s+(.*?)\s+Peak/BG', measurement
-            )
-            int_background_types_match = re.findall(
-                r'Peak/BG\s+(.*?)\s+Meas. intensity', measurement
-            )
-            int_background_values_match = re.findall(
-                r'Meas. intensity\s+(.*?)\n', measurement
-            )
+            int_background_lines_match = INT_BACKGROUND_LINES_RE.findall(measurement)
+            int_background_types_match = INT_BACKGROUND_TYPES_RE.findall(measurement)
+            int_background_values_match = INT_BACKGROUND_VALUES_RE.findall(measurement)
 
             # Check if all necessary information was found
             if all(
@@ -16,23 +16,12 @@
 # limitations under the License.
 #
 
-from typing import (
-    TYPE_CHECKING,
-)
-
-if TYPE_CHECKING:
-    from nomad.datamodel.datamodel import (
-        EntryArchive,
-    )
-    from structlog.stdlib import (
-        BoundLogger,
-    )
-
+import os
 from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
-    dict,
+    Optional,
 )
 
 import numpy as np
@@ -68,15 +57,50 @@ from nomad_measurements import (
 )
 from nomad_measurements.utils import merge_sections
 
-from nomad_ubik_plugin.schema_packages import XRFreader
-
 if TYPE_CHECKING:
-    from structlog.stdlib import BoundLogger
+    from nomad.datamodel.datamodel import (
+        EntryArchive,
+    )
+    from structlog.stdlib import (
+        BoundLogger,
+    )
 
 
 m_package = Package(name='nomad_xrf')
 
 
+def _read_xrf_txt(source: Any, logger: 'BoundLogger' = None) -> dict[str, Any]:
+    """
+    Function for reading a UBIK `.txt` file with `XRFreader.read_xrf_txt`. The reader
+    module is only imported once a file is read.
+
+    Args:
+        source (Any): The path to the `.txt` file or an opened file object.
+        logger (BoundLogger): A structlog logger.
+
+    Returns:
+        dict[str, Any]: The X-ray fluorescence data in a Python dictionary.
+    """
+    from nomad_ubik_plugin.schema_packages import XRFreader  # noqa: PLC0415
+
+    return XRFreader.read_xrf_txt(source, logger)
+
+
+# Read functions for the supported data files, keyed by lower case file suffix
+_READERS: dict[str, Callable] = {
+    '.txt': _read_xrf_txt,
+}
+
+# Measurement keys that are written into `XRFSettings`
+_SETTINGS_QUANTITIES = (
+    'xray_energy',
+    'current',
+    'spot_size',
+    'integration_time',
+    'element_line',
+)
+
+
 class XRFElementalComposition(ElementalComposition):
     """
     Section extending ElementalComposition with XRF relevant properties.
@@ -242,16 +266,16 @@ class ELNXRayFluorescence(XRayFluorescence, EntryData):
         section_def=ReadableIdentifiers,
     )
 
-    def get_read_function(self) -> Callable:
+    def get_read_function(self) -> Optional[Callable]:
         """
         Method for getting the correct read function for the current data file.
 
         Returns:
-            Callable: The read function.
+            Optional[Callable]: The read function or `None` if the file type is not
+            supported.
         """
         # TODO: Reader selection must be more specific
-        if self.data_file.endswith('.txt'):
-            return XRFreader.read_xrf_txt
+        return _READERS.get(os.path.splitext(self.data_file)[1].lower())
 
     def write_xrf_data(
         self,
@@ -267,60 +291,67 @@ class ELNXRayFluorescence(XRayFluorescence, EntryData):
             archive (EntryArchive): The archive containing the section.
             logger (BoundLogger): A structlog logger.
         """
-        # Initialize results and samples lists
-        list_of_results = []
+        # Settings are only created if the data provides any of them
+        xrf_settings = None
+
+        # Initialize results and samples lists, results are preallocated
+        list_of_results = [None] * len(xrf_dict)
         list_of_samples = []
+        seen_lab_ids: set[str] = set()
 
         # write for each measurement in xrf_dict
-        for data in xrf_dict.values():
-            name = data.get('application', None)
-            date = data.get('date', None)
+        for i, data in enumerate(xrf_dict.values()):
+            name = data.get('application')
+            date = data.get('date')
+
+            if xrf_settings is None:
+                settings = {
+                    key: data[key] for key in _SETTINGS_QUANTITIES if key in data
+                }
+                if settings:
+                    xrf_settings = XRFSettings(**settings)
+                    xrf_settings.normalize(archive, logger)
 
             # create list of XRFLayers each with a list of XRFElementalCompositions
-            list_of_XRFLayers = []
-            for layer, content in data.get('layers', []).items():
-                list_of_ElementalCompositions = []
-                for element, attributes in content.get('elements', {}).items():
-                    list_of_ElementalCompositions.append(
-                        XRFElementalComposition(
-                            element=element,
-                            mass_fraction=attributes.get('mass_fraction'),
-                            atomic_fraction=attributes.get('atomic_fraction'),
-                            line=attributes.get('line'),
-                            intensity_peak=attributes.get('intensity_peak'),
-                            intensity_background=attributes.get('intensity_background'),
-                            intensity_background_2=attributes.get(
-                                'intensity_background_2'
-                            ),
-                        )
-                    )
-                list_of_XRFLayers.append(
-                    XRFLayer(
-                        name=layer,
-                        thickness=content.get('thickness', None),
-                        elements=list_of_ElementalCompositions,
+            layers = data.get('layers') or {}
+            list_of_XRFLayers = [None] * len(layers)
+            for j, layer in enumerate(layers):
+                content = layers[layer]
+                elements = content.get('elements') or {}
+                list_of_ElementalCompositions = [None] * len(elements)
+                for k, element in enumerate(elements):
+                    get = elements[element].get
+                    list_of_ElementalCompositions[k] = XRFElementalComposition(
+                        element=element,
+                        mass_fraction=get('mass_fraction'),
+                        atomic_fraction=get('atomic_fraction'),
+                        line=get('line'),
+                        intensity_peak=get('intensity_peak'),
+                        intensity_background=get('intensity_background'),
+                        intensity_background_2=get('intensity_background_2'),
                     )
+                list_of_XRFLayers[j] = XRFLayer(
+                    name=layer,
+                    thickness=content.get('thickness'),
+                    elements=list_of_ElementalCompositions,
                 )
 
-            sample = CompositeSystemReference(
-                lab_id=data.get('sample_name', None),
-            )
             # append new sample to samples list
-            if sample not in list_of_samples:
+            lab_id = data.get('sample_name')
+            if lab_id not in seen_lab_ids:
+                seen_lab_ids.add(lab_id)
+                sample = CompositeSystemReference(lab_id=lab_id)
                 sample.normalize(archive, logger)
                 list_of_samples.append(sample)
 
-            # append new result to results list
+            # add new result to results list
             result = XRFResult(
                 name=name,
                 date=date,
                 layer=list_of_XRFLayers,
             )
             result.normalize(archive, logger)
-            list_of_results.append(result)
-
-        xrf_settings = XRFSettings()
-        xrf_settings.normalize(archive, logger)
+            list_of_results[i] = result
 
         xrf = ELNXRayFluorescence(
             results=list_of_results,
@@ -347,14 +378,12 @@ class ELNXRayFluorescence(XRayFluorescence, EntryData):
                     )
             else:
                 with archive.m_context.raw_file(self.data_file) as file:
-                    xrf_dict = read_function(file.name, logger)
+                    xrf_dict = read_function(file, logger)
                 if xrf_dict:
                     self.write_xrf_data(xrf_dict, archive, logger)
                 elif logger is not None:
                     logger.warn(f'No XRF data found in file: "{self.data_file}".')
         super().normalize(archive, logger)
-        if not self.results:
-            return
 
 
 m_package.__init_metainfo__()
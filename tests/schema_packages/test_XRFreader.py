@@ -0,0 +1,38 @@
+import os.path
+from datetime import datetime
+
+import pytest
+from nomad.units import ureg
+
+from nomad_ubik_plugin.schema_packages.XRFreader import read_xrf_txt
+
+test_file = os.path.join('tests', 'data', 'ubik_xrf.txt')
+
+
+def test_read_xrf_txt_from_path():
+    xrf_dict = read_xrf_txt(test_file)
+
+    assert list(xrf_dict) == ['CIGS_standard', 'CIGS_fast']
+    measurement = xrf_dict['CIGS_standard']
+    assert measurement['sample_name'] == 'Sample_1'
+    assert measurement['date'] == datetime(2024, 3, 3, 9, 33)
+
+    layers = measurement['layers']
+    assert list(layers) == ['CIGS', 'Mo-layer', 'Substrate']
+    assert layers['CIGS']['thickness'] == 1500 * ureg('nm')
+    assert layers['CIGS']['elements']['Cu'] == dict(
+        mass_fraction=21.0,
+        line='CuKa',
+        intensity_peak=120.5,
+        intensity_background=1.2,
+        intensity_background_2=1.3,
+    )
+    assert layers['Substrate']['elements'] == {'Si': dict(atomic_fraction=100.0)}
+
+
+@pytest.mark.parametrize('mode', ['r', 'rb'])
+def test_read_xrf_txt_from_file_object(mode):
+    with open(test_file, mode) as file:
+        xrf_dict = read_xrf_txt(file)
+
+    assert xrf_dict == read_xrf_txt(test_file)
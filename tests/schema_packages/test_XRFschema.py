@@ -0,0 +1,38 @@
+import logging
+from datetime import datetime
+
+from nomad.datamodel import EntryArchive
+from nomad.datamodel.metainfo.basesections import CompositeSystemReference
+from nomad.units import ureg
+
+from nomad_ubik_plugin.schema_packages.XRFschema import ELNXRayFluorescence
+
+
+def test_write_xrf_data_deduplicates_samples(monkeypatch):
+    # skip the search for the referenced sample entry
+    monkeypatch.setattr(
+        CompositeSystemReference, 'normalize', lambda self, archive, logger: None
+    )
+    xrf_dict = {
+        application: dict(
+            application=application,
+            sample_name='Sample 1',
+            date=datetime(2024, 3, 3, 9, 33),
+            layers={
+                'Cu layer': dict(
+                    thickness=100 * ureg('nm'),
+                    elements={'Cu': dict(mass_fraction=100.0)},
+                ),
+            },
+        )
+        for application in ('Measurement 1', 'Measurement 2')
+    }
+
+    xrf = ELNXRayFluorescence()
+    xrf.write_xrf_data(xrf_dict, EntryArchive(), logging.getLogger())
+
+    assert [result.name for result in xrf.results] == [
+        'Measurement 1',
+        'Measurement 2',
+    ]
+    assert [sample.lab_id for sample in xrf.samples] == ['Sample 1']